@@ -31,13 +31,15 @@ def get_consent_date_from_subject_id(
     Returns:
         Optional[str]: The consent date if found, None otherwise.
     """
-    query = f"""
+    query = """
         SELECT consent_date
         FROM subjects
-        WHERE subject_id = '{subject_id}' AND study_id = '{study_id}';
+        WHERE subject_id = %s AND study_id = %s;
     """
 
-    results = db.fetch_record(config_file=config_file, query=query)
+    results = db.fetch_record(
+        config_file=config_file, query=query, params=(subject_id, study_id)
+    )
 
     if results is None:
         return None
@@ -56,16 +58,16 @@ def get_subject_ids(config_file: Path, study_id: str) -> List[str]:
     Returns:
         List[str]: A list of subject IDs.
     """
-    query = f"""
+    query = """
         SELECT subject_id
         FROM subjects
-        WHERE study_id = '{study_id}'
+        WHERE study_id = %s
         ORDER BY subject_id;
     """
 
-    results = db.execute_sql(config_file=config_file, query=query)
-
-    subject_ids = results["subject_id"].tolist()
+    subject_ids = db.fetch_column(
+        config_file=config_file, query=query, params=(study_id,)
+    )
 
     return subject_ids
 
@@ -89,6 +91,9 @@ def get_openface_datatypes(config_file: Path, csv_file: Path) -> Dict[str, str]:
     """
     Assigns a SQL datatype to each column in the csv file.
 
+    Only the header line of the csv file is read, so this is independent of
+    the size of the file.
+
     Args:
         config_file (str): The path to the configuration file.
         csv_file (str): The path to the CSV file.
@@ -100,9 +105,9 @@ def get_openface_datatypes(config_file: Path, csv_file: Path) -> Dict[str, str]:
 
     params = utils.config(path=config_file, section="openface_features")
 
-    int_cols = params["int_cols"].split(",")
-    bool_cols = params["bool_cols"].split(",")
-    time_cols = params["time_cols"].split(",")
+    int_cols = set(params["int_cols"].split(","))
+    bool_cols = set(params["bool_cols"].split(","))
+    time_cols = set(params["time_cols"].split(","))
 
     # rest of the columns are floats
 
@@ -144,15 +149,19 @@ def get_openface_path(
     subject_id = dpdash_dict["subject"]
     study_id = dpdash_dict["study"]
 
-    query = f"""
+    query = """
     SELECT subject_of_processed_path, interviewer_of_processed_path
     FROM load_openface
-    WHERE interview_name = '{interview_name}'
-        AND subject_id = '{subject_id}'
-        AND study_id = '{study_id}'
+    WHERE interview_name = %s
+        AND subject_id = %s
+        AND study_id = %s
     """
 
-    results = db.execute_sql(config_file=config_file, query=query)
+    results = db.execute_sql(
+        config_file=config_file,
+        query=query,
+        params=(interview_name, subject_id, study_id),
+    )
 
     if results.empty:
         logger.error(
@@ -285,17 +294,19 @@ def get_interview_visit_count(config_file: Path, interview_name: str) -> Optiona
 
     subject_id = dpdash_dict["subject"]
 
-    sql_query = f"""
+    sql_query = """
         SELECT buffer.interview_count FROM (
             SELECT interview_name, interview_date,
                 DENSE_RANK() OVER(ORDER BY interview_date ASC) AS interview_count
             FROM interviews AS osi
-            WHERE subject_id = '{subject_id}'
+            WHERE subject_id = %s
         ) AS buffer
-        WHERE buffer.interview_name = '{interview_name}';
+        WHERE buffer.interview_name = %s;
     """
 
-    visit_count = db.fetch_record(config_file=config_file, query=sql_query)
+    visit_count = db.fetch_record(
+        config_file=config_file, query=sql_query, params=(subject_id, interview_name)
+    )
 
     if visit_count is None:
         return None
@@ -314,13 +325,15 @@ def get_total_visits_for_subject(config_file: Path, subject_id: str) -> int:
     Returns:
         int: The total number of visits for the subject.
     """
-    query = f"""
+    query = """
     SELECT COUNT(DISTINCT interview_name) AS total_visits
     FROM interviews
-    WHERE subject_id = '{subject_id}';
+    WHERE subject_id = %s;
     """
 
-    results = db.fetch_record(config_file=config_file, query=query)
+    results = db.fetch_record(
+        config_file=config_file, query=query, params=(subject_id,)
+    )
 
     if results is None:
         return 0
@@ -339,13 +352,15 @@ def get_interview_datetime(config_file: Path, interview_name: str) -> datetime:
     Returns:
         datetime: The datetime of the interview.
     """
-    query = f"""
+    query = """
     SELECT interview_date
     FROM interviews
-    WHERE interview_name = '{interview_name}';
+    WHERE interview_name = %s;
     """
 
-    results = db.fetch_record(config_file=config_file, query=query)
+    results = db.fetch_record(
+        config_file=config_file, query=query, params=(interview_name,)
+    )
 
     if results is None:
         raise ValueError(f"No interview date found for interview {interview_name}")
@@ -366,13 +381,15 @@ def get_interview_type(config_file: Path, interview_name: str) -> str:
     Returns:
         str: The type of the interview.
     """
-    query = f"""
+    query = """
     SELECT interview_type
     FROM interviews
-    WHERE interview_name = '{interview_name}';
+    WHERE interview_name = %s;
     """
 
-    results = db.fetch_record(config_file=config_file, query=query)
+    results = db.fetch_record(
+        config_file=config_file, query=query, params=(interview_name,)
+    )
 
     if results is None:
         raise ValueError(f"No interview type found for interview {interview_name}")
@@ -395,13 +412,15 @@ def get_interview_stream(
         config_file=config_file, interview_name=interview_name, role=role
     )
 
-    stream_query = f"""
+    stream_query = """
         SELECT vs_path
         FROM openface
-        WHERE of_processed_path = '{of_path}'
+        WHERE of_processed_path = %s
     """
 
-    stream_path = db.fetch_record(config_file=config_file, query=stream_query)
+    stream_path = db.fetch_record(
+        config_file=config_file, query=stream_query, params=(str(of_path),)
+    )
 
     if stream_path is None:
         return None
@@ -421,13 +440,15 @@ def get_interview_stream_from_openface_path(
         Optional[Path]: The path to the video stream if found, None otherwise.
     """
 
-    stream_query = f"""
+    stream_query = """
         SELECT vs_path
         FROM openface
-        WHERE of_processed_path = '{of_path}'
+        WHERE of_processed_path = %s
     """
 
-    stream_path = db.fetch_record(config_file=config_file, query=stream_query)
+    stream_path = db.fetch_record(
+        config_file=config_file, query=stream_query, params=(str(of_path),)
+    )
 
     if stream_path is None:
         return None
@@ -452,13 +473,15 @@ def get_interview_duration(config_file: Path, interview_name: str) -> int:
         role=InterviewRole.SUBJECT,
     )
 
-    query = f"""
+    query = """
     SELECT fm_duration
     FROM ffprobe_metadata
-    WHERE fm_source_path = '{stream_path}';
+    WHERE fm_source_path = %s;
     """
 
-    results = db.fetch_record(config_file=config_file, query=query)
+    results = db.fetch_record(
+        config_file=config_file, query=query, params=(str(stream_path),)
+    )
 
     if results is None:
         raise ValueError(f"No interview duration found for interview {interview_name}")
@@ -477,13 +500,15 @@ def get_interview_path(interview_name: str, config_file: Path) -> Optional[Path]
     Returns:
         Optional[Path]: The path to the interview if found, None otherwise.
     """
-    query = f"""
+    query = """
     SELECT interview_path
     FROM interviews
-    WHERE interview_name = '{interview_name}'
+    WHERE interview_name = %s
     """
 
-    result = db.fetch_record(config_file=config_file, query=query)
+    result = db.fetch_record(
+        config_file=config_file, query=query, params=(interview_name,)
+    )
 
     if result is not None:
         interview_path = Path(result)
@@ -535,24 +560,27 @@ def fetch_openface_features(
                 "{'", "'.join(cols)}"
             FROM openface_features
             WHERE success = TRUE AND
-                interview_name = '{interview_name}' AND
-                subject_id = '{subject_id}' AND
-                study_id = '{study_id}' AND
-                ir_role = '{role}';
+                interview_name = %s AND
+                subject_id = %s AND
+                study_id = %s AND
+                ir_role = %s;
         """
     else:
         sql_query = f"""
             SELECT
                 "{'", "'.join(cols)}"
             FROM openface_features
-            WHERE interview_name = '{interview_name}' AND
-                subject_id = '{subject_id}' AND
-                study_id = '{study_id}' AND
-                ir_role = '{role}';
+            WHERE interview_name = %s AND
+                subject_id = %s AND
+                study_id = %s AND
+                ir_role = %s;
         """
 
     session_of_features = db.execute_sql(
-        config_file=config_file, query=sql_query, db="openface_db"
+        config_file=config_file,
+        query=sql_query,
+        db="openface_db",
+        params=(interview_name, subject_id, study_id, str(role)),
     )
 
     return session_of_features
@@ -579,13 +607,16 @@ def fetch_openface_subject_distribution(
         SELECT
             "{'", "'.join(cols)}"
         FROM openface_features AS openface
-        WHERE subject_id = '{subject_id}' AND
+        WHERE subject_id = %s AND
             ir_role = 'subject' AND
             openface.success = True;
     """
 
     subject_of_features = db.execute_sql(
-        config_file=config_file, query=sql_query, db="openface_db"
+        config_file=config_file,
+        query=sql_query,
+        db="openface_db",
+        params=(subject_id,),
     )
 
     return subject_of_features
@@ -602,13 +633,13 @@ def get_study_visits_count(config_file: Path, study_id: str) -> Optional[int]:
     Returns:
         Optional[int]: The number of visits if found, None otherwise.
     """
-    query = f"""
+    query = """
     SELECT COUNT(DISTINCT interview_name) AS total_visits
     FROM interviews
-    WHERE study_id = '{study_id}';
+    WHERE study_id = %s;
     """
 
-    results = db.fetch_record(config_file=config_file, query=query)
+    results = db.fetch_record(config_file=config_file, query=query, params=(study_id,))
 
     if results is None:
         return None
@@ -627,13 +658,13 @@ def get_study_subjects_count(config_file: Path, study_id: str) -> Optional[int]:
     Returns:
         Optional[int]: The number of subjects if found, None otherwise.
     """
-    query = f"""
+    query = """
     SELECT COUNT(DISTINCT subject_id) AS total_subjects
     FROM subjects
-    WHERE study_id = '{study_id}';
+    WHERE study_id = %s;
     """
 
-    results = db.fetch_record(config_file=config_file, query=query)
+    results = db.fetch_record(config_file=config_file, query=query, params=(study_id,))
 
     if results is None:
         return None
@@ -659,15 +690,17 @@ def fetch_openface_qc(
         config_file=config_file, interview_name=interview_name, role=ir_role
     )
 
-    sql_query = f"""
+    sql_query = """
         SELECT
             sucessful_frames_percentage,
             successful_frames_confidence_mean
         FROM openface_qc
-        WHERE of_processed_path = '{processed_path}'
+        WHERE of_processed_path = %s
     """
 
-    df = db.execute_sql(config_file=config_file, query=sql_query)
+    df = db.execute_sql(
+        config_file=config_file, query=sql_query, params=(str(processed_path),)
+    )
 
     return df
 
@@ -779,13 +812,15 @@ def get_pdf_report_path(
     Returns:
         Path: The path to the PDF report.
     """
-    query = f"""
+    query = """
     SELECT pr_path
     FROM pdf_reports
-    WHERE interview_name = '{interview_name}' AND pr_version = '{report_version}';
+    WHERE interview_name = %s AND pr_version = %s;
     """
 
-    results = db.fetch_record(config_file=config_file, query=query)
+    results = db.fetch_record(
+        config_file=config_file, query=query, params=(interview_name, report_version)
+    )
 
     if results is None:
         return None
@@ -97,11 +97,9 @@ def construct_dest_dir(
         str: The destination directory for the decrypted file.
     """
     # Get PARTICIPANT_ID and INTERVIEW_NAME from osir_audio_video_file_path
-    # INTERVIEW_NAME = encrypted_file_path.split("/")[-2]
-    participant_id = str(encrypted_file_path).split("/")[-5]
+    participant_id = encrypted_file_path.parts[-5]
 
-    destination_dir = Path(
-        data_root,
+    destination_dir = data_root.joinpath(
         "PROTECTED",
         study_id,
         participant_id,
@@ -113,7 +111,7 @@ def construct_dest_dir(
     if not destination_dir.exists():
         destination_dir.mkdir(parents=True)
 
-    return Path(destination_dir)
+    return destination_dir
 
 
 def construct_dest_file_name(file_to_decrypt: Path, interview_name: str) -> str:
@@ -4,10 +4,9 @@ Helper functions for loading OpenFace features into the database.
 
 import logging
 from pathlib import Path
-from typing import Dict, List
+from typing import Iterable, Iterator, List, Tuple
 
 import pandas as pd
-from tqdm import tqdm
 
 from pipeline import core
 from pipeline.core import metadata
@@ -18,6 +17,25 @@ from pipeline.models.load_openface import LoadOpenface
 logger = logging.getLogger(__name__)
 
 
+class OpenfaceRows:
+    """
+    Rows of OpenFace features to insert, generated lazily from a DataFrame.
+
+    Unlike a generator, this can be iterated again, so the insert can be retried.
+    Values are passed as strings, and cast by Postgres to the column types.
+    """
+
+    __slots__ = ("df", "prefix")
+
+    def __init__(self, df: pd.DataFrame, prefix: Tuple[str, ...]):
+        self.df = df
+        self.prefix = prefix
+
+    def __iter__(self) -> Iterator[Tuple[str, ...]]:
+        for row in self.df.itertuples(index=False, name=None):
+            yield (*self.prefix, *map(str, row))
+
+
 def get_interview_to_process(config_file: Path, study_id: str):
     """
     Fetch an interview to process from the database.
@@ -249,16 +267,19 @@ def construct_load_openface(
     return lof
 
 
-def construct_insert_queries(
+def construct_insert_values(
     config_file: Path,
     interview_name: str,
     role: str,
     subject_id: str,
     study_id: str,
     csv_file: Path,
-) -> List[str]:
+) -> Tuple[str, Iterable[Tuple[str, ...]]]:
     """
-    Constructs a list of SQL insert queries for OpenFace features from a CSV file.
+    Constructs a SQL insert query and the rows to insert for OpenFace features
+    from a CSV file, for use with `db.execute_values`.
+
+    Rows are generated lazily, so only the DataFrame is held in memory.
 
     Args:
         interview_name (str): The name of the interview.
@@ -267,7 +288,8 @@ def construct_insert_queries(
         csv_file (str): The path to the CSV file containing the OpenFace features.
 
     Returns:
-        List[str]: A list of SQL insert queries.
+        Tuple[str, Iterable[Tuple[str, ...]]]: The SQL insert query, and the rows
+            to insert.
     """
     df = pd.read_csv(csv_file, on_bad_lines="skip")
 
@@ -294,33 +316,20 @@ def construct_insert_queries(
         except ValueError as e:
             print(f"Error casting {col} with value {df[col]} to {datatype}: {e}")
 
-    queries: List[str] = []
-
-    for _, row in tqdm(df.iterrows(), total=len(df)):
-        vals: Dict[str, str] = {}
-
-        for col in cols:
-            vals[col] = str(row[col])
-
-        query = f"""
-            INSERT INTO openface_features (
-                interview_name,
-                ir_role,
-                subject_id,
-                study_id,
-                {", ".join(['"' + col + '"' for col in cols])}
-            ) VALUES (
-                '{interview_name}',
-                '{role}',
-                '{subject_id}',
-                '{study_id}',
-                {", ".join(["'" + vals[col] + "'" for col in cols])}
-            ) ON CONFLICT (interview_name, ir_role, frame, face_id) DO NOTHING;
-        """
+    query = f"""
+        INSERT INTO openface_features (
+            interview_name,
+            ir_role,
+            subject_id,
+            study_id,
+            {", ".join(['"' + col + '"' for col in cols])}
+        ) VALUES %s
+        ON CONFLICT (interview_name, ir_role, frame, face_id) DO NOTHING;
+    """
 
-        queries.append(query)
+    rows = OpenfaceRows(df=df, prefix=(interview_name, role, subject_id, study_id))
 
-    return queries
+    return query, rows
 
 
 def import_of_openface_db(config_file: Path, lof: LoadOpenface) -> LoadOpenface:
@@ -331,7 +340,7 @@ def import_of_openface_db(config_file: Path, lof: LoadOpenface) -> LoadOpenface:
         config_file (Path): Path to the config file.
         lof (LoadOpenface): LoadOpenface object.
     """
-    queries: List[str] = []
+    inserts: List[Tuple[str, Iterable[Tuple[str, ...]]]] = []
 
     if lof.lof_report_generation_possible is True:
         with Timer() as timer:
@@ -348,8 +357,8 @@ def import_of_openface_db(config_file: Path, lof: LoadOpenface) -> LoadOpenface:
                     raise ValueError(message)
 
                 csv_file = csv_files[0]
-                queries.extend(
-                    construct_insert_queries(
+                inserts.append(
+                    construct_insert_values(
                         config_file=config_file,
                         interview_name=lof.interview_name,
                         role="interviewer",
@@ -372,8 +381,8 @@ def import_of_openface_db(config_file: Path, lof: LoadOpenface) -> LoadOpenface:
                     raise ValueError(message)
 
                 csv_file = csv_files[0]
-                queries.extend(
-                    construct_insert_queries(
+                inserts.append(
+                    construct_insert_values(
                         config_file=config_file,
                         interview_name=lof.interview_name,
                         role="subject",
@@ -386,11 +395,9 @@ def import_of_openface_db(config_file: Path, lof: LoadOpenface) -> LoadOpenface:
         logger.info(
             f"Importing OpenFace features to openface_db for {lof.interview_name}"
         )
-        db.execute_queries(
+        db.execute_values(
             config_file=config_file,
-            queries=queries,
-            show_commands=False,
-            show_progress=True,
+            queries=inserts,
             db="openface_db",
         )
 
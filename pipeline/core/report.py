@@ -3,8 +3,9 @@ Helper functions for the report generation module.
 """
 
 import logging
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Collection, List, Optional
 
 from pipeline import core, orchestrator
 from pipeline.helpers import db, dpdash, utils
@@ -14,36 +15,71 @@ from pipeline.report import main as report
 logger = logging.getLogger(__name__)
 
 
-def get_interview_name_to_process(config_file: Path, study_id: str) -> Optional[str]:
+def get_interview_names_to_process(
+    config_file: Path,
+    study_id: str,
+    limit: int = 64,
+    exclude: Collection[str] = (),
+) -> List[str]:
     """
-    Get the interview name to process from the database.
+    Get a batch of interview names to process from the database.
 
     Args:
         config_file (Path): The path to the config file.
         study_id (str): The study_id.
+        limit (int, optional): The maximum number of interview names to return.
+            Defaults to 64.
+        exclude (Collection[str], optional): Interview names to skip, e.g. ones
+            that already failed in this run. Defaults to ().
 
     Returns:
-        Optional[str]: The interview name to process.
+        List[str]: The interview names to process.
     """
 
-    query = f"""
-        SELECT interview_name
+    # NOT EXISTS lets Postgres plan an anti-join against pdf_reports, and ordering
+    # by interview_name avoids sorting every candidate row on a random key.
+    # Since the order is fixed, interviews that failed must be excluded, or they
+    # would be picked again first.
+    query = """
+        SELECT load_openface.interview_name
         FROM load_openface
-        WHERE study_id = '{study_id}' AND
-            lof_report_generation_possible = TRUE AND
-            interview_name NOT IN (
-                SELECT interview_name
+        WHERE load_openface.study_id = %s AND
+            load_openface.lof_report_generation_possible = TRUE AND
+            NOT EXISTS (
+                SELECT 1
                 FROM pdf_reports
-            )
-        ORDER BY RANDOM()
-        LIMIT 1;
+                WHERE pdf_reports.interview_name = load_openface.interview_name
+            ) AND
+            load_openface.interview_name <> ALL(%s::text[])
+        ORDER BY load_openface.interview_name
+        LIMIT %s;
     """
 
-    interview_name = db.fetch_record(config_file=config_file, query=query)
+    interview_names = db.fetch_column(
+        config_file=config_file,
+        query=query,
+        params=(study_id, list(exclude), limit),
+    )
+
+    return interview_names
+
+
+@lru_cache(maxsize=8)
+def _get_data_root(config_file: Path) -> Path:
+    """
+    Cached wrapper around `orchestrator.get_data_root`, to avoid re-reading
+    the config file for every report.
 
-    return interview_name
+    Args:
+        config_file (Path): The path to the config file.
+
+    Returns:
+        Path: The data root directory.
+    """
+    return orchestrator.get_data_root(config_file=config_file)
 
 
+@lru_cache(maxsize=8)
 def is_anonimization_requested(config_file: Path) -> bool:
     """
     Check if the anonymization is requested from the config file.
@@ -78,7 +114,7 @@ def construct_report_path(config_file: Path, interview_name: str) -> Path:
     Returns:
         Path: The path to the report.
     """
-    data_root = orchestrator.get_data_root(config_file=config_file)
+    data_root = _get_data_root(config_file=config_file)
 
     dpdash_dict = dpdash.parse_dpdash_name(interview_name)
 
@@ -3,12 +3,13 @@ Functions to wipe data from the database.
 """
 
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 import logging
 
+import pandas as pd
+
 from pipeline.helpers import cli, db, utils
 from pipeline import core
-from pipeline.models.interview_roles import InterviewRole
 from pipeline.models.pdf_reports import PdfReport
 from pipeline.models.load_openface import LoadOpenface
 from pipeline.models.openface_qc import OpenfaceQC
@@ -101,23 +102,75 @@ def get_decrypted_files(
         List[Path]: List of decrypted files
     """
 
-    sql_query = f"""
+    sql_query = """
         SELECT decrypted_files.destination_path
         FROM decrypted_files
         INNER JOIN interview_files ON decrypted_files.source_path = interview_files.interview_file
         INNER JOIN interviews ON interview_files.interview_path = interviews.interview_path
-        WHERE interviews.interview_name = '{interview_name}';
+        WHERE interviews.interview_name = %s;
     """
 
-    decrypted_files = db.execute_sql(
+    files = db.fetch_column(
         config_file=config_file,
         query=sql_query,
+        params=(interview_name,),
     )
-    files = decrypted_files["destination_path"].tolist()
 
     return [Path(file) for file in files]
 
 
+def get_streams_and_openface_paths(
+    config_file: Path,
+    interview_name: str,
+) -> Tuple[List[Path], List[Path]]:
+    """
+    Returns the video streams and OpenFace output directories for a given interview,
+    for both the interviewer and the subject, using a single query.
+
+    Only OpenFace directories that exist on disk (and their streams) are returned.
+
+    Args:
+        config_file (Path): Path to the config file
+        interview_name (str): Name of the interview
+
+    Returns:
+        Tuple[List[Path], List[Path]]: List of video streams, List of OpenFace paths
+    """
+
+    sql_query = """
+        SELECT openface_paths.of_processed_path, openface.vs_path
+        FROM load_openface
+        CROSS JOIN LATERAL (
+            VALUES
+                (load_openface.interviewer_of_processed_path),
+                (load_openface.subject_of_processed_path)
+        ) AS openface_paths (of_processed_path)
+        LEFT JOIN openface
+            ON openface.of_processed_path = openface_paths.of_processed_path
+        WHERE load_openface.interview_name = %s
+            AND openface_paths.of_processed_path IS NOT NULL;
+    """
+
+    results = db.execute_sql(
+        config_file=config_file,
+        query=sql_query,
+        params=(interview_name,),
+    )
+
+    streams: List[Path] = []
+    of_paths: List[Path] = []
+    for _, row in results.iterrows():
+        of_path = Path(row["of_processed_path"])
+        if not of_path.exists():
+            continue
+
+        of_paths.append(of_path)
+        if pd.notna(row["vs_path"]):
+            streams.append(Path(row["vs_path"]))
+
+    return streams, of_paths
+
+
 def get_interview_files(
     config_file: Path,
     interview_name: str,
@@ -135,42 +188,14 @@ def get_interview_files(
     """
 
     related_files: List[Path] = []
-    roles = [InterviewRole.INTERVIEWER, InterviewRole.SUBJECT]
 
     decrypted_files = get_decrypted_files(
         config_file=config_file, interview_name=interview_name
     )
 
-    streams: List[Path] = []
-    of_paths: List[Path] = []
-    for role in roles:
-        try:
-            stream = core.get_interview_stream(
-                config_file=config_file,
-                interview_name=interview_name,
-                role=role,
-            )
-        except FileNotFoundError:
-            stream = None
-        except ValueError:
-            stream = None
-
-        if stream is not None:
-            streams.append(stream)
-
-        try:
-            of_path = core.get_openface_path(
-                config_file=config_file,
-                interview_name=interview_name,
-                role=role,
-            )
-        except FileNotFoundError:
-            of_path = None
-        except ValueError:
-            of_path = None
-
-        if of_path is not None:
-            of_paths.append(of_path)
+    streams, of_paths = get_streams_and_openface_paths(
+        config_file=config_file, interview_name=interview_name
+    )
 
     try:
         report_path = core.get_pdf_report_path(
@@ -231,42 +256,13 @@ def drop_interview_queries(
         List[str]: List of SQL queries.
     """
 
-    roles = [InterviewRole.INTERVIEWER, InterviewRole.SUBJECT]
-
     decrypted_files = get_decrypted_files(
         config_file=config_file, interview_name=interview_name
     )
 
-    streams: List[Path] = []
-    of_paths: List[Path] = []
-    for role in roles:
-        try:
-            stream = core.get_interview_stream(
-                config_file=config_file,
-                interview_name=interview_name,
-                role=role,
-            )
-        except FileNotFoundError:
-            stream = None
-        except ValueError:
-            stream = None
-
-        if stream is not None:
-            streams.append(stream)
-
-        try:
-            of_path = core.get_openface_path(
-                config_file=config_file,
-                interview_name=interview_name,
-                role=role,
-            )
-        except FileNotFoundError:
-            of_path = None
-        except ValueError:
-            of_path = None
-
-        if of_path is not None:
-            of_paths.append(of_path)
+    streams, of_paths = get_streams_and_openface_paths(
+        config_file=config_file, interview_name=interview_name
+    )
 
     sql_queries = []
     drop_report_query = PdfReport.drop_row_query(
@@ -81,19 +81,20 @@ def set_report_generation_not_possible(
         logger.info("Self-healing is disabled. Ignoring...")
         return
 
-    query = f"""
+    # Bind the reason as a parameter, since it may be an exception message
+    query = """
         UPDATE
             load_openface
         SET
             lof_report_generation_possible = False,
-            lof_notes = '{reason}'
+            lof_notes = %s
         WHERE
-            interview_name = '{interview_name}'
+            interview_name = %s
     """
 
     db.execute_queries(
         config_file=config_file,
-        queries=[query],
+        queries=[(query, (reason, interview_name))],
         show_commands=False,
         silent=True,
     )
@@ -2,6 +2,7 @@
 Module providing command line interface for the pipeline.
 """
 
+import fcntl
 import logging
 import os
 import random
@@ -10,6 +11,7 @@ import signal
 import subprocess
 import sys
 import tempfile
+from functools import lru_cache
 from pathlib import Path
 from typing import Callable, List, Optional
 
@@ -17,12 +19,18 @@ from pipeline.helpers.config import config
 
 logger = logging.getLogger(__name__)
 
+# ioctl request number for FICLONE (linux/fs.h), used to reflink files on
+# copy-on-write filesystems (XFS, Btrfs)
+FICLONE = 0x40049409
 
+
+@lru_cache(maxsize=1)
 def get_repo_root() -> str:
     """
     Returns the root directory of the current Git repository.
 
     Uses the command `git rev-parse --show-toplevel` to get the root directory.
+    The result is cached, so `git` is only spawned once per process.
     """
     repo_root = subprocess.check_output(["git", "rev-parse", "--show-toplevel"])
     repo_root = repo_root.decode("utf-8").strip()
@@ -62,6 +70,79 @@ def create_link(source: Path, destination: Path, softlink: bool = True) -> None:
         destination.hardlink_to(source)
 
 
+def copy_file(source: Path, destination: Path) -> None:
+    """
+    Copy a file from the source to the destination.
+
+    Attempts the cheapest copy available, falling back to the next one on failure:
+    - a reflink, on copy-on-write filesystems
+    - an in-kernel copy with copy_file_range(2)
+    - a regular copy
+
+    File metadata (mode, timestamps) is preserved, like `shutil.copy2`.
+
+    Args:
+        source (Path): The file to copy.
+        destination (Path): The path to copy the file to.
+
+    Returns:
+        None
+
+    Raises:
+        shutil.SameFileError: If the destination is the source, or a hard link to it.
+    """
+    # Opening the destination for writing truncates it, which would empty the source
+    if destination.exists() and os.path.samefile(source, destination):
+        raise shutil.SameFileError(f"{source} and {destination} are the same file")
+
+    try:
+        with open(source, "rb") as src, open(destination, "wb") as dst:
+            try:
+                fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+            except OSError:
+                copy_file_range(src.fileno(), dst.fileno())
+        shutil.copystat(source, destination)
+        return
+    except OSError:
+        pass
+
+    shutil.copy2(source, destination)
+
+
+def copy_file_range(src_fd: int, dst_fd: int) -> None:
+    """
+    Copy the contents of one file descriptor to another with copy_file_range(2).
+
+    The data is copied page cache to page cache inside the kernel, without
+    passing through user space.
+
+    Args:
+        src_fd (int): The file descriptor to copy from.
+        dst_fd (int): The file descriptor to copy to.
+
+    Returns:
+        None
+
+    Raises:
+        OSError: If copy_file_range(2) is not supported for these files, or
+            copies fewer bytes than the size of the source.
+    """
+    if not hasattr(os, "copy_file_range"):
+        raise OSError("copy_file_range is not available on this platform")
+
+    remaining = os.fstat(src_fd).st_size
+    offset = 0
+    while remaining > 0:
+        copied = os.copy_file_range(src_fd, dst_fd, remaining, offset, offset)
+        if copied == 0:
+            # The source shrank, or the filesystem declined the copy
+            raise OSError(
+                f"copy_file_range stopped with {remaining} byte(s) left to copy"
+            )
+        offset += copied
+        remaining -= copied
+
+
 def redirect_temp_dir(new_temp_dir: Path) -> None:
     """
     Changes the temporary directory to the given directory.
@@ -4,20 +4,44 @@ Helper functions for interacting with a PostgreSQL database.
 
 import json
 import logging
+import os
 import sys
+import threading
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Callable, Dict, Literal, Optional
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 import pandas as pd
 import psycopg2
 import sqlalchemy
+from psycopg2 import extras, pool
 
 from pipeline import orchestrator
 from pipeline.helpers import cli, utils
 
 logger = logging.getLogger(__name__)
 
+# Connection pools and engines, keyed by (config_file, db, pid).
+# The pid guards against reusing connections inherited by forked processes.
+_connection_pools: Dict[Tuple[Path, str, int], pool.ThreadedConnectionPool] = {}
+_engines: Dict[Tuple[Path, str, int], sqlalchemy.engine.base.Engine] = {}
+_connection_lock = threading.Lock()
+
+T = TypeVar("T")
+
 
 def handle_null(query: str) -> str:
     """
@@ -114,6 +138,117 @@ def get_db_credentials(config_file: Path, db: str = "postgresql") -> Dict[str, s
     return credentials
 
 
+def get_connection_pool(
+    config_file: Path, db: str = "postgresql"
+) -> pool.ThreadedConnectionPool:
+    """
+    Returns the connection pool for the database, creating it on first use.
+
+    Reusing pooled connections avoids connecting and authenticating for every
+    call to `execute_queries`.
+
+    Args:
+        config_file (Path): The path to the configuration file.
+        db (str, optional): The section of the configuration file to use.
+            Defaults to "postgresql".
+
+    Returns:
+        pool.ThreadedConnectionPool: The connection pool.
+    """
+    key = (config_file, db, os.getpid())
+
+    with _connection_lock:
+        if key not in _connection_pools:
+            credentials = get_db_credentials(config_file=config_file, db=db)
+            _connection_pools[key] = pool.ThreadedConnectionPool(
+                minconn=1, maxconn=8, **credentials  # type: ignore
+            )
+
+    return _connection_pools[key]
+
+
+@contextmanager
+def pooled_connection(
+    config_file: Path, db: str = "postgresql"
+) -> Iterator[psycopg2.extensions.connection]:
+    """
+    Takes a connection from the pool, and returns it to the pool when done.
+
+    If the block raises, the transaction is rolled back, so the connection goes
+    back to the pool in a clean state. If it cannot be rolled back, or the
+    connection was lost, it is closed and discarded instead.
+
+    Args:
+        config_file (Path): The path to the configuration file.
+        db (str, optional): The section of the configuration file to use.
+            Defaults to "postgresql".
+
+    Yields:
+        psycopg2.extensions.connection: A connection from the pool.
+    """
+    connection_pool = get_connection_pool(config_file=config_file, db=db)
+    conn = connection_pool.getconn()
+
+    # Discard connections known to be unusable, without a round trip
+    if (
+        conn.closed
+        or conn.info.transaction_status
+        == psycopg2.extensions.TRANSACTION_STATUS_UNKNOWN
+    ):
+        connection_pool.putconn(conn, close=True)
+        conn = connection_pool.getconn()
+
+    try:
+        yield conn
+    except BaseException:
+        if not conn.closed:
+            try:
+                conn.rollback()
+            except psycopg2.Error:
+                conn.close()
+        raise
+    finally:
+        connection_pool.putconn(conn, close=bool(conn.closed))
+
+
+def run_with_connection(
+    config_file: Path,
+    func: Callable[[psycopg2.extensions.connection], T],
+    db: str = "postgresql",
+    retry: bool = True,
+) -> T:
+    """
+    Runs `func` with a pooled connection, retrying once if the connection was lost.
+
+    Pooled connections sit idle while runners snooze, and may be dropped by a
+    server restart or a network timeout in the meantime. This only shows up on
+    the first query, so that query is retried once on a new connection.
+
+    Args:
+        config_file (Path): The path to the configuration file.
+        func (Callable[[psycopg2.extensions.connection], T]): The function to run.
+            It must commit its own transaction.
+        db (str, optional): The section of the configuration file to use.
+            Defaults to "postgresql".
+        retry (bool, optional): Whether `func` may be run again. Defaults to True.
+
+    Returns:
+        T: The return value of `func`.
+    """
+    conn = None
+    try:
+        with pooled_connection(config_file=config_file, db=db) as conn:
+            return func(conn)
+    except psycopg2.OperationalError:
+        # Only retry if an open connection was lost, not if connecting failed
+        if not retry or conn is None or not conn.closed:
+            raise
+        logger.warning("Lost connection to the database, reconnecting.")
+
+    with pooled_connection(config_file=config_file, db=db) as conn:
+        return func(conn)
+
+
 def execute_queries(
     config_file: Path,
     queries: list,
@@ -130,7 +265,9 @@ def execute_queries(
     Args:
         config_file_path (str): The path to the configuration file containing
             the connection parameters.
-        queries (list): A list of SQL queries to execute.
+        queries (list): A list of SQL queries to execute. Each query is either a
+            string, or a (query, params) tuple, with params bound to the '%s'
+            placeholders in the query.
         show_commands (bool, optional): Whether to display the executed SQL queries.
             Defaults to True.
         show_progress (bool, optional): Whether to display a progress bar. Defaults to False.
@@ -142,9 +279,8 @@ def execute_queries(
     Returns:
         list: A list of tuples containing the results of the executed queries.
     """
-    conn = None
     command = None
-    output = []
+    output: list = []
 
     if backup:
         repo_root = cli.get_repo_root()
@@ -157,20 +293,28 @@ def execute_queries(
 
         with open(backup_file, "w", encoding="utf-8") as f:
             for query in queries:
+                if isinstance(query, tuple):
+                    query, params = query
+                    f.write(f"-- params: {params}\n")
                 f.write(query + ";\n\n")
 
         orchestrator.fix_permissions(config_file=config_file, file_path=backup_file)
 
-    try:
-        credentials = get_db_credentials(config_file=config_file, db=db)
-        conn = psycopg2.connect(**credentials)  # type: ignore
+    def run_queries(conn: psycopg2.extensions.connection) -> list:
+        nonlocal command
+        output = []
         cur = conn.cursor()
 
-        def execute_query(query: str):
+        def execute_query(query: Union[str, Tuple[str, Optional[Tuple[Any, ...]]]]):
+            params = None
+            if isinstance(query, tuple):
+                query, params = query
             if show_commands:
                 logger.debug("Executing query:")
                 logger.debug(f"[bold blue]{query}", extra={"markup": True})
-            cur.execute(query)
+                if params is not None:
+                    logger.debug(f"[blue]With params: {params}", extra={"markup": True})
+            cur.execute(query, params)
             try:
                 output.append(cur.fetchall())
             except psycopg2.ProgrammingError:
@@ -192,6 +336,11 @@ def execute_queries(
 
         conn.commit()
 
+        return output
+
+    try:
+        output = run_with_connection(config_file=config_file, func=run_queries, db=db)
+
         if not silent:
             logger.debug(
                 f"[grey]Executed {len(queries)} SQL query(ies).", extra={"markup": True}
@@ -205,13 +354,71 @@ def execute_queries(
             on_failure()
         else:
             raise e
-    finally:
-        if conn is not None:
-            conn.close()
 
     return output
 
 
+def execute_values(
+    config_file: Path,
+    queries: List[Tuple[str, Iterable[Tuple[Any, ...]]]],
+    db: str = "postgresql",
+    page_size: int = 500,
+    on_failure: Optional[Callable] = on_failure,
+) -> None:
+    """
+    Executes INSERT queries for many rows, in a single transaction.
+
+    Uses `psycopg2.extras.execute_values`, which sends `page_size` rows per
+    statement, instead of one statement per row.
+
+    Args:
+        config_file (Path): The path to the configuration file.
+        queries (List[Tuple[str, Iterable[Tuple[Any, ...]]]]): (query, rows) pairs.
+            Each query has a single '%s' placeholder for the VALUES list.
+            e.g. "INSERT INTO table (a, b) VALUES %s"
+            Rows are iterated again if the connection is lost and the inserts are
+            retried. One-shot iterators (e.g. generators) are not retried.
+        db (str, optional): The section of the configuration file to use.
+            Defaults to "postgresql".
+        page_size (int, optional): The number of rows per statement. Defaults to 500.
+
+    Returns:
+        None
+    """
+    query = None
+
+    def run_inserts(conn: psycopg2.extensions.connection) -> None:
+        nonlocal query
+        cur = conn.cursor()
+
+        for query, values in queries:
+            extras.execute_values(cur, query, values, page_size=page_size)
+
+        cur.close()
+
+        conn.commit()
+
+    try:
+        # Retrying would skip the rows already consumed from a one-shot iterator
+        retry = not any(isinstance(values, Iterator) for _, values in queries)
+        run_with_connection(
+            config_file=config_file, func=run_inserts, db=db, retry=retry
+        )
+
+        logger.debug(
+            f"[grey]Executed {len(queries)} INSERT query(ies).", extra={"markup": True}
+        )
+    except (Exception, psycopg2.DatabaseError) as e:
+        logger.error("[bold red]Error executing values.", extra={"markup": True})
+        if query is not None:
+            logger.error(f"[red]For query: {query}", extra={"markup": True})
+        logger.error(e)
+        if on_failure is not None:
+            on_failure()
+        else:
+            raise e
+
+
 def get_db_connection(
     config_file: Path, db: str = "postgresql"
 ) -> sqlalchemy.engine.base.Engine:
@@ -235,13 +442,46 @@ def get_db_connection(
         + ":"
         + credentials["port"]
         + "/"
-        + credentials["database"]
+        + credentials["database"],
+        # Engines are cached, check pooled connections before reuse
+        pool_pre_ping=True,
     )
 
     return engine
 
 
-def execute_sql(config_file: Path, query: str, db: str = "postgresql") -> pd.DataFrame:
+def get_db_engine(
+    config_file: Path, db: str = "postgresql"
+) -> sqlalchemy.engine.base.Engine:
+    """
+    Returns the database engine, creating it on first use.
+
+    The engine is kept for the lifetime of the process, so its connection pool
+    is reused across queries.
+
+    Args:
+        config_file (Path): The path to the configuration file.
+        db (str, optional): The section of the configuration file to use.
+            Defaults to "postgresql".
+
+    Returns:
+        sqlalchemy.engine.base.Engine: The database connection engine.
+    """
+    key = (config_file, db, os.getpid())
+
+    with _connection_lock:
+        if key not in _engines:
+            _engines[key] = get_db_connection(config_file=config_file, db=db)
+
+    return _engines[key]
+
+
+def execute_sql(
+    config_file: Path,
+    query: str,
+    db: str = "postgresql",
+    params: Optional[Tuple[Any, ...]] = None,
+) -> pd.DataFrame:
     """
     Executes a SQL query on a PostgreSQL database and returns the result as a pandas DataFrame.
 
@@ -249,21 +489,24 @@ def execute_sql(config_file: Path, query: str, db: str = "postgresql") -> pd.Dat
         config_file_path (str): The path to the configuration file containing the
             PostgreSQL database credentials.
         query (str): The SQL query to execute.
+        params (Optional[Tuple[Any, ...]], optional): Values for the '%s' placeholders
+            in the query. Defaults to None.
 
     Returns:
         pd.DataFrame: A pandas DataFrame containing the result of the SQL query.
     """
-    engine = get_db_connection(config_file=config_file, db=db)
+    engine = get_db_engine(config_file=config_file, db=db)
 
-    df = pd.read_sql(query, engine)
-
-    engine.dispose()
+    df = pd.read_sql(query, engine, params=params)
 
     return df
 
 
 def fetch_record(
-    config_file: Path, query: str, db: str = "postgresql"
+    config_file: Path,
+    query: str,
+    db: str = "postgresql",
+    params: Optional[Tuple[Any, ...]] = None,
 ) -> Optional[str]:
     """
     Fetches a single record from the database using the provided SQL query.
@@ -271,12 +514,14 @@ def fetch_record(
     Args:
         config_file_path (str): The path to the database configuration file.
         query (str): The SQL query to execute.
+        params (Optional[Tuple[Any, ...]], optional): Values for the '%s' placeholders
+            in the query. Defaults to None.
 
     Returns:
         Optional[str]: The value of the first column of the first row of the result set,
         or None if the result set is empty.
     """
-    df = execute_sql(config_file=config_file, query=query, db=db)
+    df = execute_sql(config_file=config_file, query=query, db=db, params=params)
 
     # Check if there is a row
     if df.shape[0] == 0:
@@ -287,6 +532,53 @@ def fetch_record(
     return str(value)
 
 
+def fetch_column(
+    config_file: Path,
+    query: str,
+    db: str = "postgresql",
+    params: Optional[Tuple[Any, ...]] = None,
+    on_failure: Optional[Callable] = on_failure,
+) -> List[Any]:
+    """
+    Fetches the first column of the result set of the provided SQL query,
+    without constructing a DataFrame.
+
+    Args:
+        config_file (Path): The path to the configuration file.
+        query (str): The SQL query to execute.
+        db (str, optional): The section of the configuration file to use.
+            Defaults to "postgresql".
+        params (Optional[Tuple[Any, ...]], optional): Values for the '%s' placeholders
+            in the query. Defaults to None.
+
+    Returns:
+        List[Any]: The values of the first column, in result set order.
+    """
+    values: List[Any] = []
+
+    def run_query(conn: psycopg2.extensions.connection) -> List[Any]:
+        with conn.cursor() as cur:
+            cur.execute(query, params)
+            rows = [row[0] for row in cur]
+        # End the read-only transaction, before returning the connection
+        conn.commit()
+
+        return rows
+
+    try:
+        values = run_with_connection(config_file=config_file, func=run_query, db=db)
+    except (Exception, psycopg2.DatabaseError) as e:
+        logger.error("[bold red]Error fetching column.", extra={"markup": True})
+        logger.error(f"[red]For query: {query}", extra={"markup": True})
+        logger.error(e)
+        if on_failure is not None:
+            on_failure()
+        else:
+            raise e
+
+    return values
+
+
 def df_to_table(
     config_file: Path,
     df: pd.DataFrame,
@@ -304,6 +596,5 @@ def df_to_table(
             if the table already exists.
     """
 
-    engine = get_db_connection(config_file=config_file)
+    engine = get_db_engine(config_file=config_file)
     df.to_sql(table_name, engine, if_exists=if_exists, index=False)
-    engine.dispose()
@@ -22,7 +22,7 @@ except ValueError:
 
 
 from datetime import datetime
-from typing import Optional
+from typing import Collection, Optional
 
 import pandas as pd
 
@@ -142,6 +142,7 @@ class DecryptedFile:
     def get_files_pending_decrytion(
         config_file: Path,
         limit: int = 10,
+        exclude: Collection[str] = (),
     ) -> pd.DataFrame:
         """
         Get the files pending decryption.
@@ -149,19 +150,23 @@ class DecryptedFile:
         Args:
             config_file (Path): The path to the configuration file.
             limit (int): The maximum number of rows to return.
+            exclude (Collection[str]): Source paths to skip, e.g. ones that
+                already failed in this run.
 
         Returns:
             pd.DataFrame: The files pending decryption.
         """
-        sql_query = f"""
+        sql_query = """
         SELECT * FROM decrypted_files
-        WHERE decrypted = FALSE
-        LIMIT {limit};
+        WHERE decrypted = FALSE AND
+            source_path <> ALL(%s::text[])
+        LIMIT %s;
         """
 
         return db.execute_sql(
             config_file=config_file,
             query=sql_query,
+            params=(list(exclude), limit),
         )
 
     @staticmethod
@@ -18,6 +18,16 @@ class File:
         file_path (Path): The path to the file.
     """
 
+    # Crawlers hold one File per interview file in memory, before inserting them
+    __slots__ = (
+        "file_path",
+        "file_name",
+        "file_type",
+        "file_size_mb",
+        "m_time",
+        "md5",
+    )
+
     def __init__(
         self,
         file_path: Path,
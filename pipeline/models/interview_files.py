@@ -18,6 +18,8 @@ class InterviewFile:
         tags (str): The tags associated with the file.
     """
 
+    __slots__ = ("interview_path", "interview_file", "tags")
+
     def __init__(self, interview_path: Path, interview_file: Path, tags: str):
         self.interview_path = interview_path
         self.interview_file = interview_file
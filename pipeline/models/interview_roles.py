@@ -21,7 +21,7 @@ except ValueError:
     pass
 
 from enum import Enum
-from typing import List
+from typing import Any, List, Tuple, Union
 
 from pipeline.helpers import utils, db
 
@@ -64,9 +64,11 @@ class InterviewRole(Enum):
             raise ValueError(f"Invalid interview role: {role}")
 
     @staticmethod
-    def init_table_query() -> List[str]:
+    def init_table_query() -> List[Union[str, Tuple[str, Tuple[Any, ...]]]]:
         """
-        Return the SQL query to create the 'interview_roles' table.
+        Return the SQL queries to create and populate the 'interview_roles' table.
+
+        The populate query is returned as a (query, params) tuple.
         """
         create_sql_query = """
         CREATE TABLE IF NOT EXISTS interview_roles (
@@ -74,17 +76,17 @@ class InterviewRole(Enum):
         );
         """
 
-        populate_sql_queries: List[str] = []
-
-        for role in InterviewRole:
-            populate_sql_queries.append(
-                f"""
-                INSERT INTO interview_roles (ir_role)
-                VALUES ('{role.value}');
-                """
-            )
+        # Roles are bound as a single text[] parameter, and unnested by Postgres
+        populate_sql_query = """
+        INSERT INTO interview_roles (ir_role)
+        SELECT unnest(%s::text[]);
+        """
+        populate_sql_params = ([role.value for role in InterviewRole],)
 
-        sql_queries: List[str] = [create_sql_query] + populate_sql_queries
+        sql_queries: List[Union[str, Tuple[str, Tuple[Any, ...]]]] = [
+            create_sql_query,
+            (populate_sql_query, populate_sql_params),
+        ]
 
         return sql_queries
 
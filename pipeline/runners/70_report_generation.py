@@ -23,7 +23,7 @@ except ValueError:
 import argparse
 import logging
 from datetime import datetime
-from typing import List
+from typing import List, Set
 
 from rich.logging import RichHandler
 
@@ -89,6 +89,8 @@ if __name__ == "__main__":
     studies = orchestrator.get_studies(config_file=config_file)
 
     COUNTER = 0
+    # Interviews that failed in this run, and must not be retried
+    failed_interview_names: Set[str] = set()
 
     logger.info(
         "[bold green]Starting report_generation loop...", extra={"markup": True}
@@ -97,12 +99,14 @@ if __name__ == "__main__":
     logger.info(f"Statring with study: {study_id}")
 
     while True:
-        # Get interview name to process
-        interview_name = report.get_interview_name_to_process(
-            config_file=config_file, study_id=study_id
+        # Get a batch of interview names to process
+        interview_names = report.get_interview_names_to_process(
+            config_file=config_file,
+            study_id=study_id,
+            exclude=failed_interview_names,
         )
 
-        if interview_name is None:
+        if not interview_names:
             if study_id == studies[-1]:
                 # Log if any reports were generated
                 if COUNTER > 0:
@@ -123,43 +127,54 @@ if __name__ == "__main__":
                 logger.info(f"Switching to study: {study_id}")
                 continue
 
-        COUNTER += 1
-        logger.info(
-            f"[cyan]Generating report for {interview_name}...",
-            extra={"markup": True},
-        )
-
-        report_path = report.construct_report_path(
-            config_file=config_file, interview_name=interview_name
-        )
+        for interview_name in interview_names:
+            COUNTER += 1
+            logger.info(
+                f"[cyan]Generating report for {interview_name}...",
+                extra={"markup": True},
+            )
 
-        with Timer() as timer:
-            ERROR_MESSAGE = report.generate_report(
-                config_file=config_file,
-                interview_name=interview_name,
-                report_path=report_path,
+            report_path = report.construct_report_path(
+                config_file=config_file, interview_name=interview_name
             )
 
-        pr_generation_time = timer.duration
-        logger.info(f"Generated report in {pr_generation_time:.2f} seconds")
+            try:
+                with Timer() as timer:
+                    ERROR_MESSAGE = report.generate_report(
+                        config_file=config_file,
+                        interview_name=interview_name,
+                        report_path=report_path,
+                    )
+            except Exception:  # pylint: disable=broad-except
+                # Likely a bug in the report code, not in the interview's data.
+                # Skip it for this run, without marking it as not possible.
+                logger.exception(f"Exception generating report for {interview_name}")
+                failed_interview_names.add(interview_name)
+                continue
+
+            pr_generation_time = timer.duration
+            logger.info(f"Generated report in {pr_generation_time:.2f} seconds")
+
+            if ERROR_MESSAGE:
+                logger.warning(
+                    f"Error generating report for {interview_name}: {ERROR_MESSAGE}"
+                )
+                healer.set_report_generation_not_possible(
+                    config_file=config_file,
+                    interview_name=interview_name,
+                    reason=ERROR_MESSAGE,
+                )
+                failed_interview_names.add(interview_name)
+                continue
 
-        if ERROR_MESSAGE:
-            logger.warning(
-                f"Error generating report for {interview_name}: {ERROR_MESSAGE}"
-            )
-            healer.set_report_generation_not_possible(
-                config_file=config_file,
+            pdf_report = PdfReport(
                 interview_name=interview_name,
-                reason=ERROR_MESSAGE,
+                pr_version="v1.0.0",
+                pr_path=str(report_path),
+                pr_generation_time=pr_generation_time,
+                pr_timestamp=datetime.now(),
             )
-            continue
-
-        pdf_report = PdfReport(
-            interview_name=interview_name,
-            pr_version="v1.0.0",
-            pr_path=str(report_path),
-            pr_generation_time=pr_generation_time,
-            pr_timestamp=datetime.now(),
-        )
 
-        report.log_pdf_report(config_file=config_file, pdf_report=pdf_report)
+            # Log each report as it completes, so a crash later in the batch
+            # does not lose the record of reports already generated
+            report.log_pdf_report(config_file=config_file, pdf_report=pdf_report)
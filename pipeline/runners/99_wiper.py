@@ -22,7 +22,8 @@ except ValueError:
 
 import argparse
 import logging
-from typing import List
+import os
+from typing import List, Set
 
 from rich.logging import RichHandler
 
@@ -53,29 +54,42 @@ def delete_files(files: List[Path], data_root: Path) -> None:
     Args:
         files (List[Path]): List of files to delete
     """
+    parent_dirs: Set[Path] = set()
+
     for file in files:
+        file_path = str(file)
+        parent_dirs.add(file.parent)
         try:
-            if file.is_file():
-                logger.debug(f"Deleting file: {file}")
-                file.unlink()
-            elif file.is_dir():
+            if os.path.isdir(file_path):
                 logger.debug(f"Deleting directory: {file}")
                 cli.remove_directory(path=file)
+            else:
+                logger.debug(f"Deleting file: {file}")
+                os.unlink(file_path)
+        except FileNotFoundError:
+            logger.warning(f"File not found: {file}. Skipping...")
 
-            parent_dir = file.parent
+    # Remove emptied parent directories in a single pass, deepest first,
+    # so each directory is only removed once. os.rmdir fails on non-empty
+    # directories, so no listing is needed.
+    removed_dirs: Set[Path] = set()
+    for parent_dir in sorted(parent_dirs, key=lambda p: len(p.parts), reverse=True):
+        while parent_dir != data_root and parent_dir not in removed_dirs:
             try:
-                while parent_dir != data_root:
-                    parent_files = list(parent_dir.iterdir())
-                    if not parent_files:
-                        logger.debug(f"Deleting directory: {parent_dir}")
-                        parent_dir.rmdir()
-                        parent_dir = parent_dir.parent
-                    else:
-                        break
+                os.rmdir(parent_dir)
             except PermissionError:
                 logger.warning(f"Permission error: {parent_dir}. Skipping...")
-        except FileNotFoundError:
-            logger.warning(f"File not found: {file}. Skipping...")
+                break
+            except FileNotFoundError:
+                logger.warning(f"File not found: {parent_dir}. Skipping...")
+                break
+            except OSError:
+                # Directory not empty
+                break
+
+            logger.debug(f"Deleted directory: {parent_dir}")
+            removed_dirs.add(parent_dir)
+            parent_dir = parent_dir.parent
 
 
 def get_interviews_to_wipe(config_file: Path, study_id: str) -> List[str]:
@@ -89,22 +103,21 @@ def get_interviews_to_wipe(config_file: Path, study_id: str) -> List[str]:
     Returns:
         str: interview_name
     """
-    sql_query = f"""
+    sql_query = """
         SELECT interviews.interview_name
         FROM decrypted_files
         INNER JOIN interview_files ON decrypted_files.source_path = interview_files.interview_file
         INNER JOIN interviews ON interview_files.interview_path = interviews.interview_path
-        WHERE interviews.study_id = '{study_id}'
+        WHERE interviews.study_id = %s
         ORDER BY interviews.interview_name ASC;
     """
 
-    result = db.execute_sql(
+    interviews = db.fetch_column(
         config_file=config_file,
         query=sql_query,
+        params=(study_id,),
     )
 
-    interviews = result["interview_name"].tolist()
-
     return interviews
 
 
@@ -23,7 +23,6 @@ except ValueError:
 import argparse
 import logging
 from typing import List, Optional, Tuple
-import shutil
 
 from rich.logging import RichHandler
 
@@ -115,11 +114,9 @@ def construct_dest_dir(
         str: The destination directory for the decrypted file.
     """
     # Get PARTICIPANT_ID and INTERVIEW_NAME from osir_audio_video_file_path
-    # INTERVIEW_NAME = encrypted_file_path.split("/")[-2]
-    participant_id = str(encrypted_file_path).split("/")[-5]
+    participant_id = encrypted_file_path.parts[-5]
 
-    destination_dir = Path(
-        data_root,
+    destination_dir = data_root.joinpath(
         "PROTECTED",
         study_id,
         participant_id,
@@ -217,7 +214,7 @@ def pull_file(
     with utils.get_progress_bar() as progress:
         logger.debug(f"Copying file: {file_to_pull} -> {path_for_pulled_file}")
         progress.add_task("Copying file...", total=None)
-        shutil.copy(file_to_pull, path_for_pulled_file)
+        cli.copy_file(source=file_to_pull, destination=path_for_pulled_file)
 
     if not path_for_pulled_file.exists():
         logger.error(f"Error: Pulled file not found: {path_for_pulled_file}")
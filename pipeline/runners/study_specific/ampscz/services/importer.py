@@ -27,7 +27,8 @@ except ValueError:
 
 import argparse
 import logging
-import shutil
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, Set, Tuple
 
 from rich.logging import RichHandler
 
@@ -52,23 +53,75 @@ logging.basicConfig(**logargs)
 console = utils.get_console()
 
 
-def import_file(source_path: Path, destination_path: Path) -> None:
+def import_file(source_path: Path, destination_path: Path) -> float:
     """
     Imports the file to the destination directory.
 
+    Note: The destination directory must already exist.
+
     Args:
         source_path (Path): The path to the file to import.
         destination_path (Path): The path to the destination directory.
+
+    Returns:
+        float: The time it took to import the file, in seconds.
     """
     logger.info(f"Importing file: {source_path} -> {destination_path}")
 
-    with utils.get_progress_bar() as progress:
-        progress.add_task("Copying file...", total=None)
+    with Timer() as timer:
+        cli.copy_file(source=source_path, destination=destination_path)
+
+    return timer.duration  # type: ignore
 
-        if not destination_path.parent.exists():
-            destination_path.parent.mkdir(parents=True)
 
-        shutil.copy(source_path, destination_path)
+def import_files(
+    files_to_import: List[Tuple[Path, Path]], max_workers: int = 8
+) -> Dict[Path, float]:
+    """
+    Imports the files to their destination directories, in parallel.
+
+    Copies release the GIL while in the kernel, so threads keep multiple
+    copies in flight on the storage device.
+
+    Args:
+        files_to_import (List[Tuple[Path, Path]]): The files to import, as
+            (source_path, destination_path) pairs.
+        max_workers (int, optional): The maximum number of concurrent copies.
+            Defaults to 8.
+
+    Returns:
+        Dict[Path, float]: The time it took to import each file, keyed by source path.
+            Files that failed to import are logged, and left out.
+    """
+    process_times: Dict[Path, float] = {}
+
+    # Create each destination directory once, before the copies are started.
+    # Files of an interview share a parent, so most mkdir calls are skipped.
+    created_dirs: Set[Path] = set()
+    for _, destination_path in files_to_import:
+        destination_dir = destination_path.parent
+        if destination_dir not in created_dirs:
+            destination_dir.mkdir(parents=True, exist_ok=True)
+            created_dirs.add(destination_dir)
+            created_dirs.update(destination_dir.parents)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(
+                import_file, source_path=source_path, destination_path=destination_path
+            ): source_path
+            for source_path, destination_path in files_to_import
+        }
+
+        for future in as_completed(futures):
+            source_path = futures[future]
+            try:
+                process_times[source_path] = future.result()
+            except Exception as e:  # pylint: disable=broad-except
+                # Keep the other copies, the caller decides whether to retry
+                logger.error(f"Error importing file: {source_path}: {e}")
+
+    return process_times
 
 
 if __name__ == "__main__":
@@ -105,16 +158,19 @@ if __name__ == "__main__":
     data_root = orchestrator.get_data_root(config_file=config_file)
 
     COUNTER = 0
+    # Files that failed to import in this run, and must not be retried
+    failed_source_paths: Set[str] = set()
 
     while True:
         files_to_decrypt = DecryptedFile.get_files_pending_decrytion(
-            config_file=config_file
+            config_file=config_file, exclude=failed_source_paths
         )
 
         if files_to_decrypt.empty:
             logger.info("No files to import.")
             orchestrator.snooze(config_file=config_file)
 
+        files_to_import: List[Tuple[Path, Path]] = []
         for index, row in files_to_decrypt.iterrows():
             source_path = Path(row["source_path"])
             destination_path = Path(row["destination_path"])
@@ -129,17 +185,26 @@ if __name__ == "__main__":
                 )
                 destination_path.unlink()
 
-            with Timer() as timer:
-                import_file(source_path=source_path, destination_path=destination_path)
-                orchestrator.fix_permissions(config_file=config_file, file_path=data_root)
+            files_to_import.append((source_path, destination_path))
+
+        process_times = import_files(files_to_import=files_to_import)
+        if process_times:
+            orchestrator.fix_permissions(config_file=config_file, file_path=data_root)
 
+        for source_path, process_time in process_times.items():
             DecryptedFile.update_decrypted_status(
                 config_file=config_file,
                 file_path=source_path,
-                process_time=timer.duration,
+                process_time=process_time,
             )
             COUNTER += 1
 
+        failed_source_paths.update(
+            str(source_path)
+            for source_path, _ in files_to_import
+            if source_path not in process_times
+        )
+
         if COUNTER >= 10:
             core.log(
                 config_file=config_file,
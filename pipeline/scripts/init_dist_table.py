@@ -72,6 +72,9 @@ def generate_drop_queries() -> List[str]:
         DROP INDEX IF EXISTS ir_role_index;
         """,
         """
+        DROP INDEX IF EXISTS subject_id_ir_role_index;
+        """,
+        """
         DROP INDEX IF EXISTS off_timestamp_index;
         """,
     ]
@@ -90,20 +93,19 @@ def generate_create_query(config_file: Path, csv_file: Path) -> str:
     """
     datatypes = core.get_openface_datatypes(config_file=config_file, csv_file=csv_file)
 
-    query = """
+    # Note: Column names are case-sensitive in PostgreSQL when using double quotes
+    #       Since OpenFace uses case sensitive column names, we will use double quotes
+    cols_sql = "".join(
+        f'"{col}" {datatype} NOT NULL,\n' for col, datatype in datatypes.items()
+    )
+
+    query = f"""
         CREATE TABLE IF NOT EXISTS openface_features (
             interview_name TEXT NOT NULL,
             subject_id TEXT NOT NULL,
             study_id TEXT NOT NULL,
             ir_role TEXT NOT NULL,
-    """
-
-    # Note: Column names are case-sensitive in PostgreSQL when using double quotes
-    #       Since OpenFace uses case sensitive column names, we will use double quotes
-    for col, datatype in datatypes.items():
-        query += f'"{col}" {datatype} NOT NULL,\n'
-
-    query += """
+    {cols_sql}
             off_timestamp TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
             PRIMARY KEY (interview_name, ir_role, frame, face_id)
         );
@@ -116,29 +118,25 @@ def finalize() -> List[str]:
     """
     Creates indexes and views, for the OpenFace features table.
 
+    Note: Lookups by interview_name (and ir_role) are served by the primary key
+    (interview_name, ir_role, frame, face_id), so no separate index is created.
+
     Returns:
         List[str]: List of queries.
     """
     queries = []
 
     index_queries = [
+        # Subject distribution lookups filter on both subject_id and ir_role
         """
-        CREATE INDEX interview_name_index
-        ON openface_features (interview_name);
-        """,
-        """
-        CREATE INDEX subject_id_index
-        ON openface_features (subject_id);
+        CREATE INDEX subject_id_ir_role_index
+        ON openface_features (subject_id, ir_role);
         """,
         """
         CREATE INDEX study_id_index
         ON openface_features (study_id);
         """,
         """
-        CREATE INDEX ir_role_index
-        ON openface_features (ir_role);
-        """,
-        """
         CREATE INDEX off_timestamp_index
         ON openface_features (off_timestamp);
         """,